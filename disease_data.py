@@ -0,0 +1,633 @@
+"""
+Disease information database for Oral Health AI.
+
+Static per-class content (symptoms, causes, treatments, urgency) in
+English and Hindi. Kept in its own module so Python builds it once per
+process instead of on every Streamlit rerun of app.py.
+"""
+
+from types import MappingProxyType
+
+# Entries shown per symptoms / causes / treatments card
+INFO_LIST_LIMIT = 6
+
+DISEASE_DATABASE = {
+    'Oral_Cancer': {
+        'en': {
+            'name': 'Oral Cancer',
+            'emoji': '🚨',
+            'risk_level': 'high',
+            'description': 'Oral cancer is a serious condition where malignant cells form in the tissues of the mouth or throat. Early detection significantly improves survival rates.',
+            'symptoms': [
+                'Persistent mouth sores that don\'t heal (>2 weeks)',
+                'White or red patches inside mouth',
+                'Lump or thickening in cheek or neck',
+                'Difficulty swallowing or chewing',
+                'Numbness in tongue, lip, or mouth',
+                'Unexplained bleeding in mouth',
+                'Chronic sore throat or hoarseness',
+                'Jaw pain or stiffness'
+            ],
+            'causes': [
+                'Tobacco use (smoking, chewing, gutka)',
+                'Heavy alcohol consumption',
+                'Human papillomavirus (HPV) infection',
+                'Excessive sun exposure (lip cancer)',
+                'Poor nutrition and diet',
+                'Weakened immune system',
+                'Family history of cancer',
+                'Chronic irritation from rough teeth'
+            ],
+            'treatments': [
+                'Surgical removal of tumor',
+                'Radiation therapy',
+                'Chemotherapy',
+                'Targeted drug therapy',
+                'Immunotherapy',
+                'Reconstructive surgery',
+                'Speech and swallowing therapy',
+                'Regular follow-up monitoring'
+            ],
+            'urgency': 'CRITICAL - Seek immediate medical attention within 24-48 hours. Do not delay!'
+        },
+        'hi': {
+            'name': 'मुंह का कैंसर',
+            'emoji': '🚨',
+            'risk_level': 'high',
+            'description': 'मुंह का कैंसर एक गंभीर स्थिति है जहां मुंह या गले के ऊतकों में घातक कोशिकाएं बनती हैं। जल्दी पता लगाने से जीवित रहने की दर में काफी सुधार होता है।',
+            'symptoms': [
+                'मुंह में न भरने वाले घाव (>2 सप्ताह)',
+                'मुंह के अंदर सफेद या लाल धब्बे',
+                'गाल या गर्दन में गांठ',
+                'निगलने या चबाने में कठिनाई',
+                'जीभ या होंठ में सुन्नता',
+                'मुंह में अस्पष्ट रक्तस्राव',
+                'लंबे समय तक गले में खराश',
+                'जबड़े में दर्द या अकड़न'
+            ],
+            'causes': [
+                'तंबाकू का उपयोग (धूम्रपान, चबाना, गुटखा)',
+                'अत्यधिक शराब का सेवन',
+                'HPV संक्रमण',
+                'अत्यधिक धूप',
+                'खराब पोषण',
+                'कमजोर प्रतिरक्षा प्रणाली',
+                'कैंसर का पारिवारिक इतिहास',
+                'खुरदरे दांतों से पुरानी जलन'
+            ],
+            'treatments': [
+                'ट्यूमर को शल्य चिकित्सा से हटाना',
+                'विकिरण चिकित्सा',
+                'कीमोथेरेपी',
+                'लक्षित दवा चिकित्सा',
+                'इम्यूनोथेरेपी',
+                'पुनर्निर्माण सर्जरी',
+                'भाषण और निगलने की थेरेपी',
+                'नियमित अनुवर्ती निगरानी'
+            ],
+            'urgency': 'गंभीर - 24-48 घंटों के भीतर तुरंत चिकित्सा सहायता लें। देरी न करें!'
+        }
+    },
+    
+    'Ulcers': {
+        'en': {
+            'name': 'Mouth Ulcers (Canker Sores)',
+            'emoji': '⚠️',
+            'risk_level': 'medium',
+            'description': 'Mouth ulcers are painful sores that appear inside the mouth. Most heal within 1-2 weeks without treatment, but persistent ulcers need evaluation.',
+            'symptoms': [
+                'Painful round or oval sores',
+                'White or yellow center with red border',
+                'Burning sensation before appearing',
+                'Difficulty eating spicy or acidic foods',
+                'Swelling around the sore',
+                'Tingling sensation in mouth',
+                'Multiple sores at once',
+                'Pain when talking or eating'
+            ],
+            'causes': [
+                'Stress and anxiety',
+                'Minor mouth injuries (biting cheek)',
+                'Acidic or spicy foods',
+                'Vitamin deficiencies (B12, iron, folate)',
+                'Hormonal changes',
+                'Food allergies or sensitivities',
+                'Certain medications',
+                'Weakened immune system'
+            ],
+            'treatments': [
+                'Antiseptic mouthwash',
+                'Pain-relieving gels (Benzocaine)',
+                'Saltwater rinse (warm)',
+                'Avoid spicy and acidic foods',
+                'Vitamin B12 supplements',
+                'Corticosteroid ointments',
+                'Soft diet during healing',
+                'Maintain good oral hygiene'
+            ],
+            'urgency': 'Monitor closely - See a dentist if ulcer persists beyond 2 weeks or recurs frequently.'
+        },
+        'hi': {
+            'name': 'मुंह के छाले',
+            'emoji': '⚠️',
+            'risk_level': 'medium',
+            'description': 'मुंह के छाले दर्दनाक घाव हैं जो मुंह के अंदर दिखाई देते हैं। अधिकांश 1-2 सप्ताह में बिना उपचार के ठीक हो जाते हैं।',
+            'symptoms': [
+                'दर्दनाक गोल या अंडाकार घाव',
+                'लाल बॉर्डर के साथ सफेद या पीला केंद्र',
+                'प्रकट होने से पहले जलन',
+                'मसालेदार खाना खाने में कठिनाई',
+                'घाव के आसपास सूजन',
+                'मुंह में झुनझुनी',
+                'एक साथ कई घाव',
+                'बात करने या खाने में दर्द'
+            ],
+            'causes': [
+                'तनाव और चिंता',
+                'मामूली मुंह की चोट',
+                'अम्लीय या मसालेदार भोजन',
+                'विटामिन की कमी (B12, आयरन)',
+                'हार्मोनल परिवर्तन',
+                'खाद्य एलर्जी',
+                'कुछ दवाइयां',
+                'कमजोर प्रतिरक्षा प्रणाली'
+            ],
+            'treatments': [
+                'एंटीसेप्टिक माउथवॉश',
+                'दर्द निवारक जेल',
+                'गर्म नमक के पानी से गरारे',
+                'मसालेदार भोजन से बचें',
+                'विटामिन B12 सप्लीमेंट',
+                'कॉर्टिकोस्टेरॉइड मलहम',
+                'नरम आहार',
+                'अच्छी मौखिक स्वच्छता'
+            ],
+            'urgency': 'निगरानी करें - यदि 2 सप्ताह से अधिक रहे या बार-बार हो तो दंत चिकित्सक से मिलें।'
+        }
+    },
+    
+    'Gingivitis': {
+        'en': {
+            'name': 'Gingivitis (Gum Disease)',
+            'emoji': '⚠️',
+            'risk_level': 'medium',
+            'description': 'Gingivitis is inflammation of the gums caused by bacterial infection. If left untreated, it can progress to periodontitis and eventual tooth loss.',
+            'symptoms': [
+                'Red, swollen gums',
+                'Bleeding while brushing or flossing',
+                'Bad breath (halitosis)',
+                'Receding gums',
+                'Tender or painful gums',
+                'Soft, puffy gum tissue',
+                'Dark red or purple gum color',
+                'Spaces between teeth and gums'
+            ],
+            'causes': [
+                'Poor oral hygiene',
+                'Plaque and tartar buildup',
+                'Smoking or tobacco use',
+                'Diabetes',
+                'Hormonal changes (pregnancy)',
+                'Certain medications',
+                'Dry mouth conditions',
+                'Poor nutrition'
+            ],
+            'treatments': [
+                'Professional dental cleaning (scaling)',
+                'Improved brushing technique',
+                'Daily flossing',
+                'Antibacterial mouthwash',
+                'Regular dental checkups',
+                'Quit smoking',
+                'Treat underlying conditions',
+                'Soft-bristled toothbrush'
+            ],
+            'urgency': 'Schedule dental visit within 1-2 weeks for professional evaluation and cleaning.'
+        },
+        'hi': {
+            'name': 'मसूड़ों की सूजन (जिंजिवाइटिस)',
+            'emoji': '⚠️',
+            'risk_level': 'medium',
+            'description': 'मसूड़े की सूजन बैक्टीरिया के संक्रमण के कारण होती है। अनुपचारित छोड़ने पर यह पेरियोडोंटाइटिस में बदल सकती है।',
+            'symptoms': [
+                'लाल, सूजे हुए मसूड़े',
+                'ब्रश करते समय खून आना',
+                'सांसों की दुर्गंध',
+                'मसूड़ों का पीछे हटना',
+                'मसूड़ों में दर्द',
+                'नरम, फूले हुए मसूड़े',
+                'गहरे लाल मसूड़े',
+                'दांतों और मसूड़ों के बीच गैप'
+            ],
+            'causes': [
+                'खराब मौखिक स्वच्छता',
+                'प्लाक और टार्टर जमाव',
+                'धूम्रपान या तंबाकू',
+                'मधुमेह',
+                'हार्मोनल परिवर्तन (गर्भावस्था)',
+                'कुछ दवाइयां',
+                'सूखा मुंह',
+                'खराब पोषण'
+            ],
+            'treatments': [
+                'पेशेवर दंत सफाई (स्केलिंग)',
+                'बेहतर ब्रशिंग तकनीक',
+                'दैनिक फ्लॉसिंग',
+                'एंटीबैक्टीरियल माउथवॉश',
+                'नियमित दंत जांच',
+                'धूम्रपान छोड़ें',
+                'अंतर्निहित स्थितियों का इलाज',
+                'नरम ब्रिसल वाला टूथब्रश'
+            ],
+            'urgency': 'पेशेवर मूल्यांकन और सफाई के लिए 1-2 सप्ताह के भीतर दंत चिकित्सक से मिलें।'
+        }
+    },
+    
+    'Caries': {
+        'en': {
+            'name': 'Dental Caries (Cavities)',
+            'emoji': '⚠️',
+            'risk_level': 'medium',
+            'description': 'Dental caries (cavities) are permanently damaged areas in teeth that develop into tiny holes. They are among the world\'s most common health problems.',
+            'symptoms': [
+                'Toothache or spontaneous pain',
+                'Sensitivity to sweet, hot, or cold',
+                'Visible holes or pits in teeth',
+                'Brown, black, or white staining',
+                'Bad breath',
+                'Pain when biting down',
+                'Visible dark spots on teeth',
+                'Food getting stuck in teeth'
+            ],
+            'causes': [
+                'Frequent snacking on sugary foods',
+                'Sugary drinks consumption',
+                'Poor brushing habits',
+                'Bacteria in mouth',
+                'Dry mouth',
+                'Lack of fluoride',
+                'Eating disorders',
+                'Acid reflux (GERD)'
+            ],
+            'treatments': [
+                'Dental fillings (amalgam or composite)',
+                'Dental crowns (severe decay)',
+                'Root canal treatment',
+                'Fluoride treatments',
+                'Tooth extraction (if necessary)',
+                'Dental sealants',
+                'Improved oral hygiene',
+                'Dietary changes'
+            ],
+            'urgency': 'Schedule dental appointment within 1-2 weeks to prevent further decay and complications.'
+        },
+        'hi': {
+            'name': 'दांतों की सड़न (कैविटी)',
+            'emoji': '⚠️',
+            'risk_level': 'medium',
+            'description': 'दंत क्षय (कैविटी) दांतों में स्थायी रूप से क्षतिग्रस्त क्षेत्र हैं जो छोटे छेद बन जाते हैं। ये दुनिया की सबसे आम स्वास्थ्य समस्याओं में से एक है।',
+            'symptoms': [
+                'दांत दर्द',
+                'मीठे, गर्म या ठंडे के प्रति संवेदनशीलता',
+                'दांतों में दिखाई देने वाले छेद',
+                'भूरे, काले या सफेद दाग',
+                'सांसों की दुर्गंध',
+                'काटते समय दर्द',
+                'दांतों पर काले धब्बे',
+                'दांतों में खाना फंसना'
+            ],
+            'causes': [
+                'मीठे खाद्य पदार्थों का बार-बार सेवन',
+                'शर्करा युक्त पेय',
+                'खराब ब्रशिंग आदतें',
+                'मुंह में बैक्टीरिया',
+                'सूखा मुंह',
+                'फ्लोराइड की कमी',
+                'खाने के विकार',
+                'एसिड रिफ्लक्स'
+            ],
+            'treatments': [
+                'डेंटल फिलिंग',
+                'डेंटल क्राउन (गंभीर सड़न)',
+                'रूट कैनाल उपचार',
+                'फ्लोराइड उपचार',
+                'दांत निकालना (यदि आवश्यक)',
+                'डेंटल सीलेंट',
+                'बेहतर मौखिक स्वच्छता',
+                'आहार में बदलाव'
+            ],
+            'urgency': 'आगे की सड़न को रोकने के लिए 1-2 सप्ताह के भीतर दंत चिकित्सक से मिलें।'
+        }
+    },
+    
+    'Calculus': {
+        'en': {
+            'name': 'Calculus (Tartar)',
+            'emoji': '📋',
+            'risk_level': 'low',
+            'description': 'Calculus (tartar) is hardened dental plaque that has mineralized on teeth. It cannot be removed by regular brushing and requires professional cleaning.',
+            'symptoms': [
+                'Yellow or brown deposits on teeth',
+                'Rough feeling on tooth surface',
+                'Bad breath',
+                'Gum irritation and inflammation',
+                'Bleeding gums',
+                'Teeth appear darker',
+                'Buildup along gum line',
+                'Receding gums'
+            ],
+            'causes': [
+                'Poor oral hygiene',
+                'Not flossing regularly',
+                'Smoking or tobacco use',
+                'Dry mouth conditions',
+                'Diet high in sugar and starch',
+                'Irregular dental visits',
+                'Certain medications',
+                'Age-related changes'
+            ],
+            'treatments': [
+                'Professional scaling and cleaning',
+                'Root planing',
+                'Improved daily oral hygiene',
+                'Electric toothbrush',
+                'Regular dental cleanings (every 6 months)',
+                'Tartar-control toothpaste',
+                'Antiseptic mouthwash',
+                'Dietary modifications'
+            ],
+            'urgency': 'Schedule professional dental cleaning within 1 month to prevent gum disease.'
+        },
+        'hi': {
+            'name': 'कैलकुलस (टार्टर)',
+            'emoji': '📋',
+            'risk_level': 'low',
+            'description': 'कैलकुलस (टार्टर) कठोर दंत पट्टिका है जो दांतों पर खनिज हो गई है। इसे नियमित ब्रश से नहीं हटाया जा सकता।',
+            'symptoms': [
+                'दांतों पर पीले या भूरे जमाव',
+                'दांतों की सतह पर खुरदरापन',
+                'सांसों की दुर्गंध',
+                'मसूड़ों में जलन और सूजन',
+                'मसूड़ों से खून',
+                'दांत गहरे दिखना',
+                'मसूड़ों की रेखा पर जमाव',
+                'मसूड़ों का पीछे हटना'
+            ],
+            'causes': [
+                'खराब मौखिक स्वच्छता',
+                'नियमित फ्लॉसिंग न करना',
+                'धूम्रपान या तंबाकू',
+                'सूखा मुंह',
+                'चीनी और स्टार्च युक्त आहार',
+                'अनियमित दंत जांच',
+                'कुछ दवाइयां',
+                'उम्र से संबंधित परिवर्तन'
+            ],
+            'treatments': [
+                'पेशेवर स्केलिंग और सफाई',
+                'रूट प्लानिंग',
+                'बेहतर दैनिक मौखिक स्वच्छता',
+                'इलेक्ट्रिक टूथब्रश',
+                'नियमित दंत सफाई (हर 6 महीने)',
+                'टार्टर-कंट्रोल टूथपेस्ट',
+                'एंटीसेप्टिक माउथवॉश',
+                'आहार में संशोधन'
+            ],
+            'urgency': 'मसूड़ों की बीमारी को रोकने के लिए 1 महीने के भीतर पेशेवर दंत सफाई करवाएं।'
+        }
+    },
+    
+    'Tooth Discoloration': {
+        'en': {
+            'name': 'Tooth Discoloration',
+            'emoji': '📋',
+            'risk_level': 'low',
+            'description': 'Tooth discoloration refers to staining or color changes in teeth. It can be extrinsic (surface stains) or intrinsic (internal discoloration).',
+            'symptoms': [
+                'Yellow or brown teeth',
+                'White spots on teeth',
+                'Gray or dark colored teeth',
+                'Uneven tooth coloring',
+                'Stains between teeth',
+                'Dull appearance of teeth',
+                'Brownish spots near gum line',
+                'Discoloration after injury'
+            ],
+            'causes': [
+                'Coffee, tea, or red wine consumption',
+                'Tobacco use',
+                'Poor dental hygiene',
+                'Certain medications (tetracycline)',
+                'Aging',
+                'Excessive fluoride (fluorosis)',
+                'Dental trauma',
+                'Genetic factors'
+            ],
+            'treatments': [
+                'Professional teeth whitening',
+                'Whitening toothpaste',
+                'Dental veneers',
+                'Dental bonding',
+                'Better oral hygiene routine',
+                'Avoiding staining foods/drinks',
+                'At-home whitening kits',
+                'Dental crowns (severe cases)'
+            ],
+            'urgency': 'Non-urgent - Cosmetic concern. Consult dentist at your convenience for whitening options.'
+        },
+        'hi': {
+            'name': 'दांतों का मलिनकिरण',
+            'emoji': '📋',
+            'risk_level': 'low',
+            'description': 'दांतों का मलिनकिरण दांतों में दाग या रंग परिवर्तन को संदर्भित करता है। यह बाहरी (सतह के दाग) या आंतरिक हो सकता है।',
+            'symptoms': [
+                'पीले या भूरे दांत',
+                'दांतों पर सफेद धब्बे',
+                'धूसर या गहरे रंग के दांत',
+                'असमान दांतों का रंग',
+                'दांतों के बीच दाग',
+                'दांतों की सुस्त उपस्थिति',
+                'मसूड़ों की रेखा के पास भूरे धब्बे',
+                'चोट के बाद मलिनकिरण'
+            ],
+            'causes': [
+                'कॉफी, चाय या रेड वाइन',
+                'तंबाकू का उपयोग',
+                'खराब दंत स्वच्छता',
+                'कुछ दवाइयां (टेट्रासाइक्लिन)',
+                'उम्र बढ़ना',
+                'अत्यधिक फ्लोराइड',
+                'दंत आघात',
+                'आनुवंशिक कारक'
+            ],
+            'treatments': [
+                'पेशेवर दांत सफेद करना',
+                'व्हाइटनिंग टूथपेस्ट',
+                'डेंटल वेनीर्स',
+                'डेंटल बॉन्डिंग',
+                'बेहतर मौखिक स्वच्छता',
+                'दाग लगाने वाले खाद्य पदार्थों से बचें',
+                'होम व्हाइटनिंग किट',
+                'डेंटल क्राउन (गंभीर मामले)'
+            ],
+            'urgency': 'गैर-जरूरी - सौंदर्य संबंधी चिंता। व्हाइटनिंग विकल्पों के लिए अपनी सुविधा अनुसार दंत चिकित्सक से मिलें।'
+        }
+    },
+    
+    'Hypodontia': {
+        'en': {
+            'name': 'Hypodontia (Missing Teeth)',
+            'emoji': '📋',
+            'risk_level': 'low',
+            'description': 'Hypodontia is a developmental condition where one or more teeth fail to develop. It can affect dental function, appearance, and jaw development.',
+            'symptoms': [
+                'Visible gaps between teeth',
+                'Difficulty chewing properly',
+                'Speech difficulties',
+                'Jawbone development issues',
+                'Misalignment of existing teeth',
+                'Aesthetic concerns',
+                'Baby teeth that don\'t fall out',
+                'Smaller than normal teeth'
+            ],
+            'causes': [
+                'Genetic factors (inherited)',
+                'Developmental abnormalities',
+                'Trauma during tooth development',
+                'Radiation therapy',
+                'Certain genetic syndromes',
+                'Environmental factors',
+                'Infections during pregnancy',
+                'Unknown causes'
+            ],
+            'treatments': [
+                'Dental implants',
+                'Fixed dental bridges',
+                'Removable partial dentures',
+                'Orthodontic treatment (braces)',
+                'Space maintainers (for children)',
+                'Dental bonding',
+                'Resin-retained bridges',
+                'Regular monitoring'
+            ],
+            'urgency': 'Non-urgent - Consult a dentist or orthodontist for evaluation of treatment options.'
+        },
+        'hi': {
+            'name': 'हाइपोडोंटिया (गायब दांत)',
+            'emoji': '📋',
+            'risk_level': 'low',
+            'description': 'हाइपोडोंटिया एक विकासात्मक स्थिति है जहां एक या अधिक दांत विकसित नहीं होते। यह दंत कार्य और जबड़े के विकास को प्रभावित कर सकता है।',
+            'symptoms': [
+                'दांतों के बीच दिखाई देने वाले गैप',
+                'ठीक से चबाने में कठिनाई',
+                'बोलने में कठिनाई',
+                'जबड़े के विकास की समस्या',
+                'मौजूदा दांतों का गलत संरेखण',
+                'सौंदर्य संबंधी चिंताएं',
+                'दूध के दांत जो नहीं गिरते',
+                'सामान्य से छोटे दांत'
+            ],
+            'causes': [
+                'आनुवंशिक कारक (विरासत में मिला)',
+                'विकासात्मक असामान्यताएं',
+                'दांत विकास के दौरान आघात',
+                'विकिरण चिकित्सा',
+                'कुछ आनुवंशिक सिंड्रोम',
+                'पर्यावरणीय कारक',
+                'गर्भावस्था के दौरान संक्रमण',
+                'अज्ञात कारण'
+            ],
+            'treatments': [
+                'डेंटल इम्प्लांट',
+                'फिक्स्ड डेंटल ब्रिज',
+                'रिमूवेबल पार्शियल डेंचर',
+                'ऑर्थोडॉन्टिक उपचार (ब्रेसेस)',
+                'स्पेस मेंटेनर (बच्चों के लिए)',
+                'डेंटल बॉन्डिंग',
+                'रेजिन-रिटेन्ड ब्रिज',
+                'नियमित निगरानी'
+            ],
+            'urgency': 'गैर-जरूरी - उपचार विकल्पों के मूल्यांकन के लिए दंत चिकित्सक या ऑर्थोडॉन्टिस्ट से मिलें।'
+        }
+    },
+    
+    'Normal_Mouth': {
+        'en': {
+            'name': 'Healthy Mouth',
+            'emoji': '✅',
+            'risk_level': 'low',
+            'description': 'Great news! Your oral health appears to be in good condition. Continue maintaining your current oral hygiene practices to keep your teeth and gums healthy.',
+            'symptoms': [
+                'Pink and firm gums',
+                'No bleeding when brushing',
+                'Fresh breath',
+                'Clean teeth without visible plaque',
+                'No pain or sensitivity',
+                'Properly aligned teeth',
+                'No visible cavities or decay',
+                'Healthy tongue color'
+            ],
+            'causes': [],
+            'treatments': [
+                'Continue brushing twice daily (2 minutes)',
+                'Floss once daily',
+                'Use fluoride toothpaste',
+                'Regular dental checkups (every 6 months)',
+                'Maintain balanced diet',
+                'Limit sugary foods and drinks',
+                'Stay hydrated',
+                'Replace toothbrush every 3-4 months'
+            ],
+            'urgency': 'Routine dental checkup every 6 months to maintain optimal oral health.'
+        },
+        'hi': {
+            'name': 'स्वस्थ मुंह',
+            'emoji': '✅',
+            'risk_level': 'low',
+            'description': 'बहुत अच्छी खबर! आपका मौखिक स्वास्थ्य अच्छी स्थिति में दिखाई देता है। अपने दांतों और मसूड़ों को स्वस्थ रखने के लिए अपनी वर्तमान मौखिक स्वच्छता प्रथाओं को जारी रखें।',
+            'symptoms': [
+                'गुलाबी और मजबूत मसूड़े',
+                'ब्रश करते समय खून नहीं आता',
+                'ताजी सांस',
+                'बिना प्लाक के साफ दांत',
+                'कोई दर्द या संवेदनशीलता नहीं',
+                'ठीक से संरेखित दांत',
+                'कोई दिखाई देने वाली कैविटी नहीं',
+                'स्वस्थ जीभ का रंग'
+            ],
+            'causes': [],
+            'treatments': [
+                'दिन में दो बार ब्रश करना जारी रखें',
+                'रोजाना फ्लॉस करें',
+                'फ्लोराइड टूथपेस्ट का उपयोग करें',
+                'नियमित दंत जांच (हर 6 महीने)',
+                'संतुलित आहार बनाए रखें',
+                'मीठे खाद्य पदार्थ सीमित करें',
+                'हाइड्रेटेड रहें',
+                'हर 3-4 महीने में टूथब्रश बदलें'
+            ],
+            'urgency': 'इष्टतम मौखिक स्वास्थ्य बनाए रखने के लिए हर 6 महीने में नियमित दंत जांच।'
+        }
+    }
+}
+
+def list_items_html(items):
+    """Render the first INFO_LIST_LIMIT entries as <li> elements"""
+    return ''.join(f'<li>{item}</li>' for item in items[:INFO_LIST_LIMIT])
+
+# The content is static, so the card lists are rendered to HTML once at
+# import and render_results only drops the strings into its template
+for languages in DISEASE_DATABASE.values():
+    for info in languages.values():
+        for field in ('symptoms', 'causes', 'treatments'):
+            info[f'{field}_html'] = list_items_html(info.get(field, []))
+
+DISEASE_DATABASE = MappingProxyType(DISEASE_DATABASE)
+
+def get_disease_info(disease_key, lang='en'):
+    """Get disease information in specified language"""
+    if disease_key in DISEASE_DATABASE:
+        if lang in DISEASE_DATABASE[disease_key]:
+            return DISEASE_DATABASE[disease_key][lang]
+        return DISEASE_DATABASE[disease_key]['en']
+    return None
@@ -0,0 +1,127 @@
+"""
+🦷 Oral Health AI - Model Conversion
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Offline conversion of the trained Keras model into deployment formats.
+
+Usage:
+    python scripts/convert_model.py [--calib-dir model/calib]
+    python scripts/convert_model.py --dynamic-range
+
+Outputs:
+    model/oral_disease_int8.tflite   Full-integer INT8 model for CPU hosts
+    model/oral_disease_model.tflite  INT8-weight model (--dynamic-range),
+                                     for when no calibration images exist
+
+Both report top-1 agreement with the Keras model on the images in
+--calib-dir; check it before deploying the file.
+"""
+
+import os
+import glob
+import argparse
+
+os.environ["TF_USE_LEGACY_KERAS"] = "1"
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
+import numpy as np
+from PIL import Image
+import tensorflow as tf
+
+KERAS_MODEL_PATH = 'model/oral_disease_model.h5'
+TFLITE_INT8_PATH = 'model/oral_disease_int8.tflite'
+TFLITE_MODEL_PATH = 'model/oral_disease_model.tflite'
+CALIB_DIR = 'model/calib'
+IMAGE_SIZE = (224, 224)
+
+def find_images(calib_dir):
+    """Sorted paths of the sample images under calib_dir"""
+    patterns = ('*.jpg', '*.jpeg', '*.png')
+    return sorted(p for pattern in patterns for p in glob.glob(os.path.join(calib_dir, '**', pattern), recursive=True))
+
+def load_calibration_images(calib_dir, limit=100):
+    """
+    Yield preprocessed calibration batches.
+    Must match preprocess_image() in app.py: RGB, 224x224, rescale=1./255
+    """
+    paths = find_images(calib_dir)
+    
+    if not paths:
+        raise SystemExit(f"No calibration images found in {calib_dir}")
+    
+    for path in paths[:limit]:
+        image = Image.open(path).convert('RGB').resize(IMAGE_SIZE, Image.Resampling.LANCZOS)
+        img_array = np.asarray(image, dtype=np.float32) / 255.0
+        yield [img_array[np.newaxis, ...]]
+
+def convert_int8(model, calib_dir, output_path=TFLITE_INT8_PATH):
+    """Full-integer post-training quantization with a representative dataset"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = lambda: load_calibration_images(calib_dir)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    # uint8 input calibrated on [0, 1] gets scale 1/255 and zero-point 0, so
+    # the app feeds raw 0-255 pixels with no host-side quantization. The
+    # graph keeps a cheap uint8->int8 requantize (a zero-point shift) in
+    # place of the float->int8 quantize op. Output stays float.
+    converter.inference_input_type = tf.uint8
+    
+    tflite_model = converter.convert()
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+    
+    print(f"Wrote {output_path} ({len(tflite_model) / 1e6:.1f} MB)")
+    return output_path
+
+def convert_dynamic_range(model, output_path=TFLITE_MODEL_PATH):
+    """Dynamic-range quantization: INT8 weights, float activations, no calibration"""
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    
+    tflite_model = converter.convert()
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+    
+    print(f"Wrote {output_path} ({len(tflite_model) / 1e6:.1f} MB)")
+    return output_path
+
+def check_agreement(model, tflite_path, calib_dir):
+    """Print how often the TFLite model's top-1 class matches the Keras model's"""
+    if not find_images(calib_dir):
+        print(f"No images in {calib_dir}; skipping the accuracy check")
+        return
+    
+    interpreter = tf.lite.Interpreter(model_path=tflite_path)
+    interpreter.allocate_tensors()
+    input_details = interpreter.get_input_details()[0]
+    output_index = interpreter.get_output_details()[0]['index']
+    
+    matches = total = 0
+    for (img_array,) in load_calibration_images(calib_dir, limit=None):
+        tflite_input = img_array
+        if np.issubdtype(input_details['dtype'], np.integer):
+            scale, zero_point = input_details['quantization']
+            tflite_input = np.rint(img_array / scale + zero_point)
+        interpreter.set_tensor(input_details['index'], tflite_input.astype(input_details['dtype']))
+        interpreter.invoke()
+        
+        expected = np.argmax(model(img_array, training=False)[0])
+        matches += int(np.argmax(interpreter.get_tensor(output_index)[0]) == expected)
+        total += 1
+    
+    print(f"Top-1 agreement with the Keras model: {matches}/{total} ({100 * matches / total:.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the oral disease model for deployment")
+    parser.add_argument('--calib-dir', default=CALIB_DIR, help="Directory of sample mouth images for INT8 calibration")
+    parser.add_argument('--dynamic-range', action='store_true', help="Quantize weights only; needs no calibration images")
+    args = parser.parse_args()
+    
+    model = tf.keras.models.load_model(KERAS_MODEL_PATH, compile=False)
+    if args.dynamic_range:
+        output_path = convert_dynamic_range(model)
+    else:
+        output_path = convert_int8(model, args.calib_dir)
+    check_agreement(model, output_path, args.calib_dir)
+
+if __name__ == "__main__":
+    main()
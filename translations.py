@@ -0,0 +1,173 @@
+"""
+UI translations for Oral Health AI.
+
+English and Hindi strings keyed by message id, looked up through
+get_text() in app.py. Kept in its own module so Python builds the dict
+once per process instead of on every Streamlit rerun of app.py.
+"""
+
+TRANSLATIONS = {
+    'en': {
+        # App title and navigation
+        'app_title': '🦷 Oral Health AI',
+        'app_subtitle': 'AI-Powered Oral Disease Screening • Early Detection Saves Lives',
+        'nav_home': '🏠 Home',
+        'nav_scan': '🔍 Scan',
+        'nav_history': '📊 Results',
+        'nav_info': 'ℹ️ About',
+        
+        # Risk Assessment
+        'risk_title': 'Risk Assessment',
+        'risk_subtitle': 'Answer these questions to assess your oral health risk factors',
+        'risk_tobacco': 'Do you use tobacco or gutkha?',
+        'risk_paan': 'Do you consume paan or betel?',
+        'risk_smoke': 'Do you smoke?',
+        'risk_alcohol': 'Do you consume alcohol regularly?',
+        'risk_submit': 'Update Risk Score',
+        'risk_high': 'HIGH RISK',
+        'risk_medium': 'MODERATE RISK',
+        'risk_low': 'LOW RISK',
+        'risk_high_msg': 'You have multiple risk factors for oral cancer. Regular screening is strongly recommended!',
+        'risk_medium_msg': 'You have some risk factors. Consider regular dental checkups.',
+        'risk_low_msg': 'Great! No major risk factors. Maintain good oral hygiene!',
+        
+        # Image Upload
+        'upload_title': 'Upload or Capture Image',
+        'upload_tab': '📁 Upload Image',
+        'camera_tab': '📷 Camera',
+        'upload_prompt': 'Upload a clear image of your mouth or teeth',
+        'camera_enable': '📷 Enable Camera',
+        'camera_disable': '❌ Disable Camera',
+        'camera_prompt': 'Position your camera to capture a clear image of the affected area',
+        'take_photo': 'Take a photo',
+        'analyze_btn': '🔍 Analyze Image',
+        'analyzing': 'Analyzing your image...',
+        'clear_btn': '🗑️ Clear & Start Over',
+        
+        # Results
+        'results_title': 'Analysis Results',
+        'confidence': 'AI Confidence Score',
+        'detected': 'Condition Detected',
+        'urgency': 'Recommended Action',
+        'symptoms_title': 'Symptoms',
+        'causes_title': 'Common Causes',
+        'treatment_title': 'Treatment Options',
+        'all_scores': 'View All Prediction Scores',
+        'heatmap_title': 'AI Attention Heatmap',
+        'heatmap_desc': 'This visualization shows where the AI focused when making its prediction. Red/yellow areas indicate high attention, blue areas indicate low attention.',
+        'original_image': 'Original Image',
+        'heatmap_image': 'AI Focus Areas',
+        
+        # Footer
+        'find_dentist': 'Find Dentists Near You',
+        'disclaimer_title': 'IMPORTANT MEDICAL DISCLAIMER',
+        'disclaimer_text': 'This AI tool is intended for SCREENING PURPOSES ONLY and should not be used as a substitute for professional medical diagnosis. The AI model has an accuracy of approximately 87% and may produce incorrect results. Always consult a qualified healthcare professional for proper diagnosis and treatment.',
+        
+        # Sidebar
+        'language': 'Language',
+        'model_performance': 'Model Performance',
+        'accuracy': 'Overall Accuracy',
+        'cancer_detection': 'Cancer Detection',
+        'training_images': 'Training Images',
+        'conditions': 'Detectable Conditions',
+        
+        # Disease names
+        'disease_Oral_Cancer': 'Oral Cancer',
+        'disease_Ulcers': 'Mouth Ulcers',
+        'disease_Gingivitis': 'Gingivitis',
+        'disease_Caries': 'Dental Caries (Cavities)',
+        'disease_Calculus': 'Calculus (Tartar)',
+        'disease_Tooth Discoloration': 'Tooth Discoloration',
+        'disease_Hypodontia': 'Hypodontia',
+        'disease_Normal_Mouth': 'Healthy Mouth',
+        
+        # Misc
+        'loading': 'Loading...',
+        'error': 'Error',
+        'success': 'Success',
+        'warning': 'Warning',
+        'no_image': 'No image selected. Please upload an image or take a photo.',
+    },
+    
+    'hi': {
+        # App title and navigation
+        'app_title': '🦷 मौखिक स्वास्थ्य AI',
+        'app_subtitle': 'AI-संचालित मौखिक रोग जांच • जल्दी पता लगाने से जीवन बचता है',
+        'nav_home': '🏠 होम',
+        'nav_scan': '🔍 स्कैन',
+        'nav_history': '📊 परिणाम',
+        'nav_info': 'ℹ️ जानकारी',
+        
+        # Risk Assessment
+        'risk_title': 'जोखिम मूल्यांकन',
+        'risk_subtitle': 'अपने मौखिक स्वास्थ्य जोखिम कारकों का आकलन करने के लिए इन प्रश्नों का उत्तर दें',
+        'risk_tobacco': 'क्या आप तंबाकू या गुटखा का उपयोग करते हैं?',
+        'risk_paan': 'क्या आप पान या सुपारी खाते हैं?',
+        'risk_smoke': 'क्या आप धूम्रपान करते हैं?',
+        'risk_alcohol': 'क्या आप नियमित रूप से शराब पीते हैं?',
+        'risk_submit': 'जोखिम स्कोर अपडेट करें',
+        'risk_high': 'उच्च जोखिम',
+        'risk_medium': 'मध्यम जोखिम',
+        'risk_low': 'कम जोखिम',
+        'risk_high_msg': 'आपके पास मुंह के कैंसर के कई जोखिम कारक हैं। नियमित जांच की दृढ़ता से अनुशंसा की जाती है!',
+        'risk_medium_msg': 'आपके पास कुछ जोखिम कारक हैं। नियमित दंत जांच पर विचार करें।',
+        'risk_low_msg': 'बहुत बढ़िया! कोई प्रमुख जोखिम कारक नहीं। अच्छी मौखिक स्वच्छता बनाए रखें!',
+        
+        # Image Upload
+        'upload_title': 'छवि अपलोड या कैप्चर करें',
+        'upload_tab': '📁 छवि अपलोड',
+        'camera_tab': '📷 कैमरा',
+        'upload_prompt': 'अपने मुंह या दांतों की एक स्पष्ट छवि अपलोड करें',
+        'camera_enable': '📷 कैमरा चालू करें',
+        'camera_disable': '❌ कैमरा बंद करें',
+        'camera_prompt': 'प्रभावित क्षेत्र की स्पष्ट छवि लेने के लिए अपना कैमरा स्थित करें',
+        'take_photo': 'फोटो लें',
+        'analyze_btn': '🔍 छवि का विश्लेषण करें',
+        'analyzing': 'आपकी छवि का विश्लेषण किया जा रहा है...',
+        'clear_btn': '🗑️ साफ़ करें और फिर से शुरू करें',
+        
+        # Results
+        'results_title': 'विश्लेषण परिणाम',
+        'confidence': 'AI विश्वास स्कोर',
+        'detected': 'पता लगाई गई स्थिति',
+        'urgency': 'अनुशंसित कार्रवाई',
+        'symptoms_title': 'लक्षण',
+        'causes_title': 'सामान्य कारण',
+        'treatment_title': 'उपचार विकल्प',
+        'all_scores': 'सभी भविष्यवाणी स्कोर देखें',
+        'heatmap_title': 'AI ध्यान हीटमैप',
+        'heatmap_desc': 'यह विज़ुअलाइज़ेशन दिखाता है कि AI ने अपनी भविष्यवाणी करते समय कहाँ ध्यान केंद्रित किया। लाल/पीले क्षेत्र उच्च ध्यान इंगित करते हैं।',
+        'original_image': 'मूल छवि',
+        'heatmap_image': 'AI फोकस क्षेत्र',
+        
+        # Footer
+        'find_dentist': 'अपने पास दंत चिकित्सक खोजें',
+        'disclaimer_title': 'महत्वपूर्ण चिकित्सा अस्वीकरण',
+        'disclaimer_text': 'यह AI उपकरण केवल स्क्रीनिंग उद्देश्यों के लिए है और पेशेवर चिकित्सा निदान का विकल्प नहीं है। AI मॉडल की सटीकता लगभग 87% है। उचित निदान और उपचार के लिए हमेशा योग्य स्वास्थ्य पेशेवर से परामर्श करें।',
+        
+        # Sidebar
+        'language': 'भाषा',
+        'model_performance': 'मॉडल प्रदर्शन',
+        'accuracy': 'समग्र सटीकता',
+        'cancer_detection': 'कैंसर पहचान',
+        'training_images': 'प्रशिक्षण छवियां',
+        'conditions': 'पता लगाने योग्य स्थितियां',
+        
+        # Disease names
+        'disease_Oral_Cancer': 'मुंह का कैंसर',
+        'disease_Ulcers': 'मुंह के छाले',
+        'disease_Gingivitis': 'मसूड़ों की सूजन',
+        'disease_Caries': 'दांतों की सड़न (कैविटी)',
+        'disease_Calculus': 'कैलकुलस (टार्टर)',
+        'disease_Tooth Discoloration': 'दांतों का मलिनकिरण',
+        'disease_Hypodontia': 'हाइपोडोंटिया',
+        'disease_Normal_Mouth': 'स्वस्थ मुंह',
+        
+        # Misc
+        'loading': 'लोड हो रहा है...',
+        'error': 'त्रुटि',
+        'success': 'सफलता',
+        'warning': 'चेतावनी',
+        'no_image': 'कोई छवि चयनित नहीं है। कृपया एक छवि अपलोड करें या फोटो लें।',
+    }
+}